@@ -1,11 +1,17 @@
+import numpy as np
+
 from .models import (
     Geometry, Outside, Initial, AirProps,
     CouplingParams, BuildingParams, BaselinePlantParams
 )
 from .actuators import (
-    ActuatorCommand, ActuatorSet, ActuatorMapping, resolve_actuation
+    ActuatorCommand, ActuatorSet, ActuatorMapping, ActuatorResolution,
+    resolve_actuation,
+)
+from .simulator import (
+    simulate, simulate_batch, make_output_buffer, row_as_dict, row_dtype,
+    ROW_DTYPE,
 )
-from .simulator import simulate
 
 def estimate_environment(
     *,
@@ -28,11 +34,17 @@ def estimate_environment(
     dt_s: float = 60.0,
     crop_area_m2: float | None = None,
     mapping: ActuatorMapping = ActuatorMapping(),
+    method: str = "euler",
+    out: np.ndarray | None = None,
+    dtype=np.float32,
 ) -> dict:
     """
     One-call API:
       - Set ON/OFF, activity (0..100), active time (s) for vents/fans/heater
       - Returns FINAL-only outputs (no time-series)
+      - method: "euler" (default) or a scipy solve_ivp method, see simulate()
+      - out: optional make_output_buffer(steps, dtype) table reused across calls
+      - dtype: float type of the rows table (float32, or np.float64 for full precision)
 
     Note: actuator->(ACH,Q_heater) mapping is a practical wrapper. The physics
     equations used inside simulate() keep the same structural logic.
@@ -59,7 +71,7 @@ def estimate_environment(
         vents_elec_w=energy["vents_elec_w"],
     )
 
-    out = simulate(
+    result = simulate(
         geom=geom,
         outside=outside,
         init=init,
@@ -69,6 +81,9 @@ def estimate_environment(
         crop_area_m2=crop_area_m2,
         dt_s=dt_s,
         elapsed_s=elapsed_s,
+        method=method,
+        out=out,
+        dtype=dtype,
     )
-    out["actuator_mapping_debug"] = dbg
-    return out
+    result["actuator_mapping_debug"] = dict(dbg)
+    return result
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+# -----------------------------
+# Optional numba (kernels of simulator.py and single_zone_greenhouse_sim.py)
+# -----------------------------
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional: run the kernels as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
@@ -1,7 +1,10 @@
 from __future__ import annotations
+import functools
 from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActuatorCommand:
     """
     Generic actuator command:
@@ -16,18 +19,20 @@ class ActuatorCommand:
     def duty(self, elapsed_s: float) -> float:
         if elapsed_s <= 0:
             return 0.0
-        return max(0.0, min(1.0, self.active_time_s / elapsed_s))
+        t = self.active_time_s / elapsed_s
+        return 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
 
     def activity01(self) -> float:
-        return max(0.0, min(1.0, self.activity_pct / 100.0))
+        a = self.activity_pct / 100.0
+        return 0.0 if a < 0.0 else (1.0 if a > 1.0 else a)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActuatorSet:
     vents: ActuatorCommand
     fans: ActuatorCommand
     heater: ActuatorCommand
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActuatorMapping:
     """
     Maps actuator setpoints -> model parameters.
@@ -54,16 +59,29 @@ class ActuatorMapping:
     cooling_fans_max_elec_w: float = 1500.0  # W fan electricity at 100% fans
     vents_motor_max_elec_w: float = 0.0      # W vent motor electricity (optional; set >0 if used)
 
+class ActuatorResolution(NamedTuple):
+    """resolve_actuation() result; unpacks as (ACH, Q_heater_w, debug, energy)."""
+    ACH: float
+    Q_heater_w: float
+    debug: Mapping[str, float]   # read-only
+    energy: Mapping[str, float]  # read-only
+
+@functools.lru_cache(maxsize=1024)
 def resolve_actuation(
     actuators: ActuatorSet,
     elapsed_s: float,
     mapping: ActuatorMapping = ActuatorMapping(),
-):
+) -> ActuatorResolution:
     """
     Returns (ACH, Q_heater_w, debug_dict, energy_dict).
 
     ACH combines vents + fans; heater maps to Q_heater_w.
     energy_dict contains per-actuator instantaneous rates used for bookkeeping.
+
+    Results are memoized on (actuators, elapsed_s, mapping); all three are
+    frozen dataclasses / floats, so repeated calls with the same settings are
+    a cache lookup. The two dicts are returned as read-only mappings because
+    the cached result is shared between callers.
     """
     v_on = 1.0 if actuators.vents.on else 0.0
     f_on = 1.0 if actuators.fans.on else 0.0
@@ -99,4 +117,4 @@ def resolve_actuation(
         "total_elec_w": heater_elec_w + cooling_elec_w + vents_elec_w,
     }
 
-    return ACH, Q_heater_w, dbg, energy
\ No newline at end of file
+    return ActuatorResolution(ACH, Q_heater_w, MappingProxyType(dbg), MappingProxyType(energy))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Geometry:
     L: float  # m
     W: float  # m
@@ -15,24 +15,24 @@ class Geometry:
     def A_floor(self) -> float:  # m^2
         return self.L * self.W
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Outside:
     T_out_c: float
     RH_out_pct: float
     G_sun_w_m2: float  # shortwave irradiance proxy (W/m^2)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Initial:
     T_air_c: float
     RH_air_pct: float
     T_canopy_c: float  # canopy initial temp (°C)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AirProps:
     rho: float = 1.20   # kg/m^3
     cp: float = 1006.0  # J/(kg*K)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CouplingParams:
     LAI: float
 
@@ -46,19 +46,19 @@ class CouplingParams:
     k_tp: float = 0.7         # transpiration parameter in Eq(16) (chosen)
     rn_gain: float = 0.70     # R_n ≈ rn_gain * G (chosen proxy)
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BaselinePlantParams:
     """Tuning/lumped parameters used in the canopy energy balance (kept same logic as before)."""
     C_can_areal: float = 30_000.0  # J/(m^2*K) effective canopy thermal mass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuildingParams:
     """Envelope/solar parameters (same role as before)."""
     UA_w_k: float              # W/K (envelope/insulation lumped)
     tau_alpha_air: float       # fraction of solar into air node
     tau_alpha_can: float       # fraction of solar into canopy node
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActuationResolved:
     """Resolved physical actuation parameters used by the simulator."""
     ACH: float           # 1/h (airflow proxy)
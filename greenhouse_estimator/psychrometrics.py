@@ -1,6 +1,8 @@
 from __future__ import annotations
 import math
 
+import numpy as np
+
 # -----------------------------
 # Psychrometrics (Eq 12–13)
 # -----------------------------
@@ -10,18 +12,29 @@ def es_magnus_tetens_pa(T_c: float) -> float:
     """Eq (13): saturated vapor pressure es (Pa), T in °C."""
     return 610.94 * math.exp((17.625 * T_c) / (243.04 + T_c))
 
+def es_magnus_tetens_pa_array(T_c: np.ndarray) -> np.ndarray:
+    """Eq (13) over an array of temperatures (°C): es (Pa), one np.exp pass."""
+    return 610.94 * np.exp((17.625 * T_c) / (243.04 + T_c))
+
+def abs_humidity_from_rh_array(T_c: np.ndarray, RH_pct: np.ndarray) -> np.ndarray:
+    """Eq (12) + Eq (13) over arrays: absolute humidity v (kg/m^3)."""
+    return es_magnus_tetens_pa_array(T_c) * (RH_pct / 100.0) / ((T_c + 273.15) * CVAP)
+
+def _es_and_Tk_cvap(T_c: float) -> tuple[float, float]:
+    """Eq (13) es (Pa) and the Eq (12) factor T_k*Cvap, in one call."""
+    es = 610.94 * math.exp((17.625 * T_c) / (243.04 + T_c))
+    return es, (T_c + 273.15) * CVAP
+
 def abs_humidity_from_rh(T_c: float, RH_pct: float) -> float:
     """Eq (12) + Eq (13): absolute humidity v (kg/m^3)."""
-    es = es_magnus_tetens_pa(T_c)
-    T_k = T_c + 273.15
-    return es * (RH_pct / 100.0) / (T_k * CVAP)
+    es, tk_cvap = _es_and_Tk_cvap(T_c)
+    return es * (RH_pct / 100.0) / tk_cvap
 
 def rh_from_abs_humidity(T_c: float, v: float) -> float:
     """Rearranged Eq (12): RH (%)."""
-    es = es_magnus_tetens_pa(T_c)
-    T_k = T_c + 273.15
-    RH = 100.0 * v * T_k * CVAP / es
-    return max(0.0, min(100.0, RH))
+    es, tk_cvap = _es_and_Tk_cvap(T_c)
+    RH = 100.0 * v * tk_cvap / es
+    return 0.0 if RH < 0.0 else (100.0 if RH > 100.0 else RH)
 
 def vapor_pressure_from_abs_humidity(T_c: float, v: float) -> float:
     """From Eq (12): v = e / (T_k * Cvap)  =>  e = v * T_k * Cvap (Pa)."""
@@ -0,0 +1,50 @@
+# cython: language_level=3
+# Compiled build of simulator._run(): same arguments, same results, no JIT
+# warm-up. Built by setup.py; simulator.py falls back to _run() without it.
+from libc.math cimport exp
+
+cdef double CVAP = 461.5  # psychrometrics.CVAP
+
+
+def run(
+    double[:] Tair_arr, double[:] vair_arr, double[:] Tcan_arr, double[:] Q_trans_arr,
+    double T_air, double v_air, double T_can, double v_out,
+    double r_sum_base, double r_s_quad, double trans_coef, double hA_can_air, double UA_env_vent,
+    double Q_air_const_W, double Q_solar_can_W,
+    double dAH_trans, double dAH_vent, double air_dt_cap, double can_dt_cap,
+):
+    """Advances (T_air, v_air, T_can) for len(Tair_arr) explicit Euler steps, see simulator._run()."""
+    cdef Py_ssize_t k
+    cdef double e_s_air, e_air, d20, e_def, Q_trans_W, Q_conv_can_to_air_W, dAH
+
+    with nogil:
+        for k in range(Tair_arr.shape[0]):
+            # Eq (13) and Eq (12)
+            e_s_air = 610.94 * exp((17.625 * T_air) / (243.04 + T_air))
+            e_air = v_air * (T_air + 273.15) * CVAP
+
+            # Eq (14)-(16)
+            d20 = T_air - 20.0
+            e_def = e_s_air - e_air
+            if e_def < 0.0:
+                e_def = 0.0
+            Q_trans_W = trans_coef * e_def / (r_sum_base + r_s_quad * d20 * d20)
+
+            Q_conv_can_to_air_W = hA_can_air * (T_can - T_air)
+
+            # Eq (17)
+            dAH = dAH_trans * Q_trans_W - dAH_vent * (v_air - v_out)
+            v_air = v_air + dAH
+            if v_air < 0.0:
+                v_air = 0.0
+
+            # Energy balance (air)
+            T_air = T_air + air_dt_cap * (Q_air_const_W - UA_env_vent * T_air + Q_conv_can_to_air_W)
+
+            # Energy balance (canopy)
+            T_can = T_can + can_dt_cap * (Q_solar_can_W - Q_conv_can_to_air_W - Q_trans_W)
+
+            Tair_arr[k] = T_air
+            vair_arr[k] = v_air
+            Tcan_arr[k] = T_can
+            Q_trans_arr[k] = Q_trans_W
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import math
-from typing import List, Dict, Optional
+from typing import Dict, Optional
 
+import numpy as np
+
+from ._jit import njit
 from .psychrometrics import (
-    abs_humidity_from_rh,
+    CVAP,
+    abs_humidity_from_rh_array,
+    es_magnus_tetens_pa_array,
     rh_from_abs_humidity,
-    vapor_pressure_from_abs_humidity,
-    es_magnus_tetens_pa,
 )
 from .models import (
     Geometry, Outside, Initial, AirProps, CouplingParams,
@@ -47,180 +50,484 @@ def build_trigger_string(
     return "|".join(flags) if flags else "none"
 
 
+def build_trigger_labels(
+    ACH: float,
+    Q_heater_w: float,
+    G_sun_w_m2: float,
+    LAI: float,
+    A_crop: float,
+) -> tuple[str, str]:
+    """
+    The run's two build_trigger_string() labels, (without, with) transpiration.
+    Every trigger input except Q_trans_W is constant for a run, so only these
+    two labels are possible: build both once and pick per step.
+    """
+    return tuple(
+        build_trigger_string(ACH, Q_heater_w, G_sun_w_m2, LAI, A_crop, Q_trans_W)
+        for Q_trans_W in (0.0, 1.0)
+    )
+
+
 # -----------------------------
-# Core coupled simulation (same structural logic)
+# Output table layout
 # -----------------------------
-def simulate(
+def row_dtype(float_dtype=np.float32) -> np.dtype:
+    """
+    Record layout of the simulate() table, one record per timestep.
+
+    Signals are stored as float_dtype (float32 by default: plenty for plotting
+    and CSV export at half the memory of float64); integration itself always runs in float64.
+    The per-step trigger label is a uint8 code into simulate()'s trigger_labels.
+    """
+    f = np.dtype(float_dtype).str
+    return np.dtype([
+        ("t_min", f),
+        ("Tout_C", f),
+        ("Tair_C", f),
+        ("RH_air_pct", f),
+        ("T_can_C", f),
+        ("trigger_code", "u1"),
+        ("airflow_m3_s", f),
+        ("ACH_1_h", f),
+
+        # Optional: instantaneous rates (can keep for diagnostics)
+        ("heater_thermal_w", f),
+        ("heater_gas_m3_h_rate", f),
+        ("heater_elec_w_rate", f),
+        ("cooling_elec_w_rate", f),
+        ("vents_elec_w_rate", f),
+
+        # Per-step consumption (optional)
+        ("heater_gas_m3_step", f),
+        ("heater_elec_kwh_step", f),
+        ("cooling_elec_kwh_step", f),
+        ("vents_elec_kwh_step", f),
+
+        # REQUIRED: cumulative consumption up to current step
+        ("heater_gas_m3_cum", f),
+        ("heater_elec_kwh_cum", f),
+        ("cooling_elec_kwh_cum", f),
+        ("vents_elec_kwh_cum", f),
+
+        # Optional combined cumulative values
+        ("cooling_total_elec_kwh_cum", f),
+        ("total_elec_kwh_cum", f),
+    ])
+
+
+# Default table layout; columns are views into the fields.
+ROW_DTYPE = row_dtype()
+
+
+def row_as_dict(rows: np.ndarray, i: int) -> Dict[str, float | str]:
+    """Row i of a simulate() table as a plain {name: value} dict, built on demand."""
+    return dict(zip(rows.dtype.names, rows[i].item()))
+
+
+def make_output_buffer(steps: int, dtype=np.float32) -> np.ndarray:
+    """Table for simulate(..., out=..., dtype=dtype) covering steps + 1 rows."""
+    return np.empty(steps + 1, dtype=row_dtype(dtype))
+
+
+# -----------------------------
+# Loop-invariant kernel inputs
+# -----------------------------
+def _kernel_inputs(
     geom: Geometry,
     outside: Outside,
     init: Initial,
     building: BuildingParams,
     act: ActuationResolved,
     coup: CouplingParams,
-    plant: BaselinePlantParams = BaselinePlantParams(),
-    air: AirProps = AirProps(),
-    crop_area_m2: Optional[float] = None,
-    dt_s: float = 60.0,
-    elapsed_s: float = 600.0,
-) -> Dict[str, object]:
+    plant: BaselinePlantParams,
+    air: AirProps,
+    crop_area_m2,
+    dt_s: float,
+) -> tuple:
     """
-    Returns:
-      - rows: time series table
-      - airflow_final_m3_s, airflow_avg_m3_s
-      - ach_final_1_h, ach_avg_1_h
-      - Tin_final_C, RHin_final_pct, Tout_C
+    Initial state and time-invariant coefficients for the integrators, in the
+    order _run() takes them after its output arrays. Written with NumPy
+    ufuncs so that any field may also be a (B,) array (see simulate_batch()).
     """
     A_crop = crop_area_m2 if crop_area_m2 is not None else geom.A_floor
     V = geom.V
     dx_airlayers = geom.H  # mapping of "air-layer thickness" to room height
 
     # Outside humidity in absolute form
-    v_out = abs_humidity_from_rh(outside.T_out_c, outside.RH_out_pct)
+    v_out = abs_humidity_from_rh_array(outside.T_out_c, outside.RH_out_pct)
 
     # Initial states
     T_air = init.T_air_c
-    v_air = abs_humidity_from_rh(init.T_air_c, init.RH_air_pct)
+    v_air = abs_humidity_from_rh_array(init.T_air_c, init.RH_air_pct)
     T_can = init.T_canopy_c
 
     # Airflow from ACH
     Vdot = act.ACH * V / 3600.0         # m^3/s
     mdot = air.rho * Vdot               # kg/s
 
-    steps = int(elapsed_s / dt_s)
-    # Energy accumulators (new)
-    heater_gas_total_m3 = 0.0
-    heater_elec_total_kwh = 0.0
-    cooling_elec_total_kwh = 0.0
-    vents_elec_total_kwh = 0.0
-    rows: List[Dict[str, float | str]] = []
+    # Net radiation proxy for Eq(16)
+    Rn = coup.rn_gain * outside.G_sun_w_m2  # W/m^2 proxy
+    LAI = np.maximum(1e-6, coup.LAI)
+
+    # Eq (16): rs = 82 + r_s_rad * (1 + 0.023*(T_air - 20)^2)
+    #   => r_b + rs = r_sum_base + r_s_quad * (T_air - 20)^2
+    r_s_rad = 570.0 * np.exp(-(coup.k_tp * Rn) / LAI)
+    r_sum_base = coup.r_b + 82.0 + r_s_rad
+    r_s_quad = 0.023 * r_s_rad
+
+    # Eq (14) with Eq (15): Q_trans = k*VEC*(es - e)*A_crop, VEC = 2*cp*rho*LAI / (k*gamma*(r_b + rs))
+    #   => Q_trans = trans_coef * (es - e) / (r_b + rs)   (k cancels)
+    trans_coef = 2.0 * air.cp * air.rho * LAI * A_crop / coup.gamma
+
+    # h = 10*LAI (Table 2): canopy-air convection conductance (W/K)
+    hA_can_air = coup.h_per_LAI * LAI * A_crop
+
+    # Envelope + ventilation sensible conductance (W/K)
+    UA_env_vent = building.UA_w_k + mdot * air.cp
+
+    Q_solar_air_W = building.tau_alpha_air * outside.G_sun_w_m2 * geom.A_floor
+    Q_solar_can_W = building.tau_alpha_can * outside.G_sun_w_m2 * geom.A_floor
 
-    # For "final and average air flow"
-    airflow_series_m3_s: List[float] = []
-    ach_series: List[float] = []
+    # State-independent part of the air energy balance (W)
+    Q_air_const_W = UA_env_vent * outside.T_out_c + act.Q_heater_w + Q_solar_air_W
 
-    for k in range(steps + 1):
-        t_min = (k * dt_s) / 60.0
+    # Eq (17): dAH = dt * (Q_trans/A_crop - (ACH/3600)*dx*k*(v_air - v_out)) / (k*dx)
+    dAH_trans = dt_s / (coup.k_lat * dx_airlayers * A_crop)
+    dAH_vent = dt_s * act.ACH / 3600.0
 
-        # --- Derived psychrometrics for Eq(14) ---
-        e_s_air = es_magnus_tetens_pa(T_air)                     # Pa
-        e_air = vapor_pressure_from_abs_humidity(T_air, v_air)   # Pa
+    air_dt_cap = dt_s / (air.rho * air.cp * V)
+    can_dt_cap = dt_s / (plant.C_can_areal * A_crop)
 
-        # --- Net radiation proxy for Eq(16) ---
-        Rn = coup.rn_gain * outside.G_sun_w_m2  # W/m^2 proxy
+    return (
+        T_air, v_air, T_can, v_out,
+        r_sum_base, r_s_quad, trans_coef, hA_can_air, UA_env_vent,
+        Q_air_const_W, Q_solar_can_W,
+        dAH_trans, dAH_vent, air_dt_cap, can_dt_cap,
+    )
 
-        # Eq (16): stomatal resistance rs (s/m)
-        LAI = max(1e-6, coup.LAI)
-        r_s = 82.0 + 570.0 * math.exp(-(coup.k_tp * Rn) / LAI) * (1.0 + 0.023 * (T_air - 20.0) ** 2)
 
-        # Eq (15): VEC
-        VEC = (2.0 * air.cp * air.rho * LAI) / (coup.k_lat * coup.gamma * (coup.r_b + r_s))
+def _energy_steps(act: ActuationResolved, dt_s: float) -> tuple:
+    """
+    Per-step consumptions (heater gas m^3, heater / cooling / vents kWh).
+    Already activity-scaled because act.* values are activity-scaled.
+    """
+    dt_h = dt_s / 3600.0
+    return (
+        act.heater_gas_m3_h * dt_h,
+        (act.heater_elec_w / 1000.0) * dt_h,
+        (act.cooling_elec_w / 1000.0) * dt_h,
+        (act.vents_elec_w / 1000.0) * dt_h,
+    )
+
+
+def _transpiration_w(T_air, v_air, r_sum_base, r_s_quad, trans_coef):
+    """Eq (12)-(16) as in _run(), on floats or ndarrays: Q_trans (W)."""
+    e_s_air = es_magnus_tetens_pa_array(T_air)
+    e_air = v_air * (T_air + 273.15) * CVAP
+    return trans_coef * np.maximum(0.0, e_s_air - e_air) / (r_sum_base + r_s_quad * (T_air - 20.0) ** 2)
+
 
-        # Eq (14): transpiration (W) over crop area
-        Q_trans_W = coup.k_lat * VEC * max(0.0, (e_s_air - e_air)) * A_crop
+# -----------------------------
+# Euler integrator kernel
+# -----------------------------
+@njit(cache=True, fastmath=True)
+def _run(
+    Tair_arr, vair_arr, Tcan_arr, Q_trans_arr,
+    T_air, v_air, T_can, v_out,
+    r_sum_base, r_s_quad, trans_coef, hA_can_air, UA_env_vent,
+    Q_air_const_W, Q_solar_can_W,
+    dAH_trans, dAH_vent, air_dt_cap, can_dt_cap,
+):
+    """
+    Advances (T_air, v_air, T_can) for len(Tair_arr) explicit Euler steps.
+    All scalar inputs are plain floats precomputed by simulate(). Writes the
+    state after each step, plus the transpiration used in that step, into
+    the four output arrays in place.
+    """
+    for k in range(Tair_arr.shape[0]):
+        # --- Derived psychrometrics for Eq(14): Eq (13) and Eq (12) ---
+        T_k = T_air + 273.15
+        e_s_air = 610.94 * math.exp((17.625 * T_air) / (243.04 + T_air))  # Pa
+        e_air = v_air * T_k * CVAP                                          # Pa
 
-        # h = 10*LAI (Table 2): canopy-air convection
-        h_can_air = coup.h_per_LAI * LAI
-        Q_conv_can_to_air_W = h_can_air * A_crop * (T_can - T_air)
+        # Eq (14)-(16): transpiration (W) over crop area, r_b + rs in the denominator
+        r_sum = r_sum_base + r_s_quad * (T_air - 20.0) ** 2
+        Q_trans_W = trans_coef * max(0.0, (e_s_air - e_air)) / r_sum
 
-        # Ventilation latent term for Eq(17)
-        Q_latent_vent_Wm2 = (act.ACH / 3600.0) * dx_airlayers * coup.k_lat * (v_air - v_out)
+        Q_conv_can_to_air_W = hA_can_air * (T_can - T_air)
 
         # Eq (17): dAH (kg/m^3) over dt
-        dAH = (dt_s * ((Q_trans_W / A_crop) - Q_latent_vent_Wm2)) / (coup.k_lat * dx_airlayers)
+        dAH = dAH_trans * Q_trans_W - dAH_vent * (v_air - v_out)
         v_air = max(0.0, v_air + dAH)
 
         # Energy balance (air)
-        Q_env_W = building.UA_w_k * (outside.T_out_c - T_air)
-        Q_vent_sens_W = mdot * air.cp * (outside.T_out_c - T_air)
-        Q_solar_air_W = building.tau_alpha_air * outside.G_sun_w_m2 * geom.A_floor
-
-        dTair_dt = (Q_env_W + Q_vent_sens_W + act.Q_heater_w + Q_solar_air_W + Q_conv_can_to_air_W) / (air.rho * air.cp * V)
-        T_air = T_air + dTair_dt * dt_s
+        T_air = T_air + air_dt_cap * (
+            Q_air_const_W - UA_env_vent * T_air + Q_conv_can_to_air_W
+        )
 
         # Energy balance (canopy)
-        Q_solar_can_W = building.tau_alpha_can * outside.G_sun_w_m2 * geom.A_floor
-        dTcan_dt = (Q_solar_can_W - Q_conv_can_to_air_W - Q_trans_W) / (plant.C_can_areal * A_crop)
-        T_can = T_can + dTcan_dt * dt_s
-
-        RH_air = rh_from_abs_humidity(T_air, v_air)
-
-        triggers = build_trigger_string(
-            ACH=act.ACH,
-            Q_heater_w=act.Q_heater_w,
-            G_sun_w_m2=outside.G_sun_w_m2,
-            LAI=coup.LAI,
-            A_crop=A_crop,
-            Q_trans_W=Q_trans_W,
+        T_can = T_can + can_dt_cap * (Q_solar_can_W - Q_conv_can_to_air_W - Q_trans_W)
+
+        Tair_arr[k] = T_air
+        vair_arr[k] = v_air
+        Tcan_arr[k] = T_can
+        Q_trans_arr[k] = Q_trans_W
+
+
+# Prefer the prebuilt C kernel (setup.py build_ext) when present: no JIT warm-up
+try:
+    from .sim_kernel import run as _euler_kernel
+except ImportError:
+    _euler_kernel = _run
+
+
+# -----------------------------
+# ODE-solver integrator (optional, SciPy)
+# -----------------------------
+def _run_ivp(
+    method, dt_s,
+    Tair_arr, vair_arr, Tcan_arr, Q_trans_arr,
+    T_air, v_air, T_can, v_out,
+    r_sum_base, r_s_quad, trans_coef, hA_can_air, UA_env_vent,
+    Q_air_const_W, Q_solar_can_W,
+    dAH_trans, dAH_vent, air_dt_cap, can_dt_cap,
+    rtol=1e-5, atol=1e-8,
+):
+    """
+    Same model as _run(), integrated with scipy.integrate.solve_ivp(method=...).
+    Takes the arguments of _run() and fills the same arrays: states at
+    t = dt_s, 2*dt_s, ..., n*dt_s and Q_trans_W at the start of each step.
+    """
+    n = Tair_arr.shape[0]
+    try:
+        from scipy.integrate import solve_ivp
+    except ImportError as exc:
+        raise ImportError(f"method={method!r} requires scipy") from exc
+
+    # Per-second rates from the per-step coefficients
+    dAH_trans_rate = dAH_trans / dt_s
+    dAH_vent_rate = dAH_vent / dt_s
+    air_cap_rate = air_dt_cap / dt_s
+    can_cap_rate = can_dt_cap / dt_s
+
+    def rhs(t, y):
+        T_a, v_a, T_c = y
+        Q_trans_W = _transpiration_w(T_a, v_a, r_sum_base, r_s_quad, trans_coef)
+        Q_conv_can_to_air_W = hA_can_air * (T_c - T_a)
+        return np.array([
+            air_cap_rate * (Q_air_const_W - UA_env_vent * T_a + Q_conv_can_to_air_W),
+            dAH_trans_rate * Q_trans_W - dAH_vent_rate * (v_a - v_out),
+            can_cap_rate * (Q_solar_can_W - Q_conv_can_to_air_W - Q_trans_W),
+        ])
+
+    t_eval = np.arange(n + 1) * dt_s
+    sol = solve_ivp(
+        rhs, (0.0, t_eval[-1]), [T_air, v_air, T_can],
+        method=method, t_eval=t_eval, rtol=rtol, atol=atol, vectorized=True,
+    )
+    if not sol.success:
+        raise RuntimeError(f"solve_ivp({method!r}) failed: {sol.message}")
+
+    # dv/dt >= 0 whenever v_air = 0, so the clamp only removes solver round-off
+    Tair, vair, Tcan = sol.y[0], np.maximum(sol.y[1], 0.0), sol.y[2]
+    Tair_arr[:] = Tair[1:]
+    vair_arr[:] = vair[1:]
+    Tcan_arr[:] = Tcan[1:]
+    Q_trans_arr[:] = _transpiration_w(Tair[:-1], vair[:-1], r_sum_base, r_s_quad, trans_coef)
+
+
+# -----------------------------
+# Batched Euler integrator (NumPy)
+# -----------------------------
+def _run_batch(
+    Tair_arr, vair_arr, Tcan_arr, Q_trans_arr,
+    T_air, v_air, T_can, v_out,
+    r_sum_base, r_s_quad, trans_coef, hA_can_air, UA_env_vent,
+    Q_air_const_W, Q_solar_can_W,
+    dAH_trans, dAH_vent, air_dt_cap, can_dt_cap,
+):
+    """
+    _run() over a batch axis: output arrays are (B, n) and every input is a
+    (B,) array, so each Euler step advances all B cases with NumPy ufuncs.
+    """
+    for k in range(Tair_arr.shape[1]):
+        Q_trans_W = _transpiration_w(T_air, v_air, r_sum_base, r_s_quad, trans_coef)
+
+        Q_conv_can_to_air_W = hA_can_air * (T_can - T_air)
+
+        # Eq (17): dAH (kg/m^3) over dt
+        dAH = dAH_trans * Q_trans_W - dAH_vent * (v_air - v_out)
+        v_air = np.maximum(0.0, v_air + dAH)
+
+        # Energy balance (air)
+        T_air = T_air + air_dt_cap * (
+            Q_air_const_W - UA_env_vent * T_air + Q_conv_can_to_air_W
         )
 
-        # airflow series
-        airflow_series_m3_s.append(Vdot)
-        ach_series.append(act.ACH)
-        # --- Per-step actuator energy bookkeeping (new) ---
-        dt_h = dt_s / 3600.0
-
-        heater_gas_m3_step = act.heater_gas_m3_h * dt_h
-        heater_elec_kwh_step = (act.heater_elec_w / 1000.0) * dt_h
-        cooling_elec_kwh_step = (act.cooling_elec_w / 1000.0) * dt_h
-        vents_elec_kwh_step = (act.vents_elec_w / 1000.0) * dt_h
-        dt_h = dt_s / 3600.0
-
-        # Step consumptions (already activity-scaled because act.* values are activity-scaled)
-        heater_gas_m3_step = act.heater_gas_m3_h * dt_h
-        heater_elec_kwh_step = (act.heater_elec_w / 1000.0) * dt_h
-        cooling_elec_kwh_step = (act.cooling_elec_w / 1000.0) * dt_h
-        vents_elec_kwh_step = (act.vents_elec_w / 1000.0) * dt_h
-
-        # Running totals (cumulative up to current timestep)
-
-        heater_gas_total_m3 += heater_gas_m3_step
-        heater_elec_total_kwh += heater_elec_kwh_step
-        cooling_elec_total_kwh += cooling_elec_kwh_step
-        vents_elec_total_kwh += vents_elec_kwh_step
-        rows.append({
-            "t_min": t_min,
-            "Tout_C": outside.T_out_c,
-            "Tair_C": T_air,
-            "RH_air_pct": RH_air,
-            "Triggers": triggers,
-            "airflow_m3_s": Vdot,
-            "ACH_1_h": act.ACH,
-
-            # Optional: instantaneous rates (can keep for diagnostics)
-            "heater_thermal_w": act.Q_heater_w,
-            "heater_gas_m3_h_rate": act.heater_gas_m3_h,
-            "heater_elec_w_rate": act.heater_elec_w,
-            "cooling_elec_w_rate": act.cooling_elec_w,
-            "vents_elec_w_rate": act.vents_elec_w,
-
-            # Per-step consumption (optional)
-            "heater_gas_m3_step": heater_gas_m3_step,
-            "heater_elec_kwh_step": heater_elec_kwh_step,
-            "cooling_elec_kwh_step": cooling_elec_kwh_step,
-            "vents_elec_kwh_step": vents_elec_kwh_step,
-
-            # REQUIRED: cumulative consumption up to current step
-            "heater_gas_m3_cum": heater_gas_total_m3,
-            "heater_elec_kwh_cum": heater_elec_total_kwh,
-            "cooling_elec_kwh_cum": cooling_elec_total_kwh,
-            "vents_elec_kwh_cum": vents_elec_total_kwh,
-
-            # Optional combined cumulative values
-            "cooling_total_elec_kwh_cum": cooling_elec_total_kwh + vents_elec_total_kwh,
-            "total_elec_kwh_cum": heater_elec_total_kwh + cooling_elec_total_kwh + vents_elec_total_kwh,
-        })
-
-    airflow_final_m3_s = airflow_series_m3_s[-1] if airflow_series_m3_s else 0.0
-    airflow_avg_m3_s = sum(airflow_series_m3_s) / len(airflow_series_m3_s) if airflow_series_m3_s else 0.0
-
-    ach_final = ach_series[-1] if ach_series else 0.0
-    ach_avg = sum(ach_series) / len(ach_series) if ach_series else 0.0
+        # Energy balance (canopy)
+        T_can = T_can + can_dt_cap * (Q_solar_can_W - Q_conv_can_to_air_W - Q_trans_W)
+
+        Tair_arr[:, k] = T_air
+        vair_arr[:, k] = v_air
+        Tcan_arr[:, k] = T_can
+        Q_trans_arr[:, k] = Q_trans_W
+
+
+# -----------------------------
+# Core coupled simulation (same structural logic)
+# -----------------------------
+def simulate(
+    geom: Geometry,
+    outside: Outside,
+    init: Initial,
+    building: BuildingParams,
+    act: ActuationResolved,
+    coup: CouplingParams,
+    plant: BaselinePlantParams = BaselinePlantParams(),
+    air: AirProps = AirProps(),
+    crop_area_m2: Optional[float] = None,
+    dt_s: float = 60.0,
+    elapsed_s: float = 600.0,
+    method: str = "euler",
+    out: Optional[np.ndarray] = None,
+    dtype=np.float32,
+) -> Dict[str, object]:
+    """
+    out: optional table from make_output_buffer(steps, dtype) that is filled in
+    place and returned as rows, so repeated runs of the same length reuse one
+    buffer (the previous run's rows are overwritten). Only the table is
+    reused: the float64 integration state (v_air, Q_trans_W, and T_air /
+    T_can unless dtype is float64) is still allocated per call.
+
+    dtype: float type of the stored signals (float32 by default); pass
+    np.float64 for a table that is bit-exact with the integration state.
+    Summary values (Tin_final_C, totals, ...) are always full precision.
+
+    method:
+      - "euler": fixed-step explicit Euler at dt_s (default)
+      - any scipy.integrate.solve_ivp method ("LSODA", "RK45", "BDF", ...):
+        adaptive integration, reported on the same dt_s grid (needs scipy)
+
+    Returns:
+      - rows: time series table (structured ndarray, row_dtype(dtype))
+      - columns: {name: ndarray} views into the rows fields
+      - trigger_labels: the run's two trigger labels (without / with
+        transpiration), indexed by the trigger_code column:
+        np.take(trigger_labels, rows["trigger_code"]) gives them per step
+      - airflow_final_m3_s, airflow_avg_m3_s
+      - ach_final_1_h, ach_avg_1_h
+      - Tin_final_C, RHin_final_pct, Tout_C
+    """
+    A_crop = crop_area_m2 if crop_area_m2 is not None else geom.A_floor
+    T_out = outside.T_out_c
+    Q_heater_w = act.Q_heater_w
+
+    # Airflow from ACH
+    Vdot = act.ACH * geom.V / 3600.0    # m^3/s
+
+    steps = int(elapsed_s / dt_s)
+    n = steps + 1
+
+    # Initial state + time-invariant terms, as plain floats for the kernel
+    inputs = tuple(
+        float(x) for x in _kernel_inputs(
+            geom, outside, init, building, act, coup, plant, air, crop_area_m2, dt_s
+        )
+    )
+
+    if out is None:
+        rows = make_output_buffer(steps, dtype)
+    elif out.dtype == row_dtype(dtype) and out.shape == (n,):
+        rows = out
+    else:
+        raise ValueError(f"out must come from make_output_buffer({steps}, {np.dtype(dtype).name})")
+
+    # The kernel integrates in float64: with a float64 table it writes T_air /
+    # T_can straight into it, otherwise into scratch that is cast on store.
+    if rows.dtype["Tair_C"] == np.float64:
+        Tair_arr = rows["Tair_C"]
+        Tcan_arr = rows["T_can_C"]
+    else:
+        Tair_arr = np.empty(n)
+        Tcan_arr = np.empty(n)
+    vair_arr = np.empty(n)
+    Q_trans_arr = np.empty(n)
+
+    if method == "euler":
+        _euler_kernel(Tair_arr, vair_arr, Tcan_arr, Q_trans_arr, *inputs)
+    else:
+        _run_ivp(method, dt_s, Tair_arr, vair_arr, Tcan_arr, Q_trans_arr, *inputs)
+
+    # Rearranged Eq (12) on the whole series at once, clipped into the table
+    e_s_arr = es_magnus_tetens_pa_array(Tair_arr)
+    np.clip(
+        100.0 * vair_arr * (Tair_arr + 273.15) * CVAP / e_s_arr, 0.0, 100.0,
+        out=rows["RH_air_pct"],
+    )
+    rows["Tair_C"] = Tair_arr
+    rows["T_can_C"] = Tcan_arr
+
+    # --- Actuator energy bookkeeping ---
+    # act.* rates are constant over the run, so the running totals are closed-form.
+    (heater_gas_m3_step, heater_elec_kwh_step,
+     cooling_elec_kwh_step, vents_elec_kwh_step) = _energy_steps(act, dt_s)
+
+    # Combined electricity per step
+    cooling_total_elec_kwh_step = cooling_elec_kwh_step + vents_elec_kwh_step
+    total_elec_kwh_step = heater_elec_kwh_step + cooling_total_elec_kwh_step
+
+    # Two possible labels per run; the table stores a code per step
+    trigger_labels = build_trigger_labels(
+        ACH=act.ACH,
+        Q_heater_w=Q_heater_w,
+        G_sun_w_m2=outside.G_sun_w_m2,
+        LAI=coup.LAI,
+        A_crop=A_crop,
+    )
+
+    rows["t_min"] = np.arange(n) * (dt_s / 60.0)
+    rows["Tout_C"] = T_out
+    rows["trigger_code"] = Q_trans_arr > 0
+    rows["airflow_m3_s"] = Vdot
+    rows["ACH_1_h"] = act.ACH
+
+    rows["heater_thermal_w"] = Q_heater_w
+    rows["heater_gas_m3_h_rate"] = act.heater_gas_m3_h
+    rows["heater_elec_w_rate"] = act.heater_elec_w
+    rows["cooling_elec_w_rate"] = act.cooling_elec_w
+    rows["vents_elec_w_rate"] = act.vents_elec_w
+
+    rows["heater_gas_m3_step"] = heater_gas_m3_step
+    rows["heater_elec_kwh_step"] = heater_elec_kwh_step
+    rows["cooling_elec_kwh_step"] = cooling_elec_kwh_step
+    rows["vents_elec_kwh_step"] = vents_elec_kwh_step
+
+    # Running totals (cumulative up to and including each timestep): k * step
+    k_done = np.arange(1, n + 1, dtype=float)
+    rows["heater_gas_m3_cum"] = k_done * heater_gas_m3_step
+    rows["heater_elec_kwh_cum"] = k_done * heater_elec_kwh_step
+    rows["cooling_elec_kwh_cum"] = k_done * cooling_elec_kwh_step
+    rows["vents_elec_kwh_cum"] = k_done * vents_elec_kwh_step
+    rows["cooling_total_elec_kwh_cum"] = k_done * cooling_total_elec_kwh_step
+    rows["total_elec_kwh_cum"] = k_done * total_elec_kwh_step
+
+    # Airflow and ACH are constant over the run in this model, so final == average.
+    # (If they become time-varying, use the airflow_m3_s / ACH_1_h columns instead.)
+    airflow_final_m3_s = airflow_avg_m3_s = Vdot
+    ach_final = ach_avg = act.ACH
+
+    heater_gas_total_m3 = n * heater_gas_m3_step
+    heater_elec_total_kwh = n * heater_elec_kwh_step
+    cooling_elec_total_kwh = n * cooling_elec_kwh_step
+    vents_elec_total_kwh = n * vents_elec_kwh_step
 
     return {
+        "columns": {name: rows[name] for name in rows.dtype.names},
         "rows": rows,
-        "Tout_C": outside.T_out_c,
-        "Tin_final_C": T_air,
-        "RHin_final_pct": RH_air,
+        "trigger_labels": trigger_labels,
+        "Tout_C": T_out,
+        "Tin_final_C": float(Tair_arr[-1]),
+        "RHin_final_pct": rh_from_abs_humidity(float(Tair_arr[-1]), float(vair_arr[-1])),
         "airflow_final_m3_s": airflow_final_m3_s,
         "airflow_avg_m3_s": airflow_avg_m3_s,
         "ach_final_1_h": ach_final,
@@ -229,5 +536,88 @@ def simulate(
         "heater_elec_total_kwh": heater_elec_total_kwh,
         "cooling_elec_total_kwh": cooling_elec_total_kwh,
         "vents_elec_total_kwh": vents_elec_total_kwh,
-        "total_elec_kwh": heater_elec_total_kwh + cooling_elec_total_kwh + vents_elec_total_kwh,
+        "total_elec_kwh": n * total_elec_kwh_step,
+    }
+
+
+# -----------------------------
+# Batched simulation (parameter sweeps)
+# -----------------------------
+def simulate_batch(
+    geom: Geometry,
+    outside: Outside,
+    init: Initial,
+    building: BuildingParams,
+    act: ActuationResolved,
+    coup: CouplingParams,
+    plant: BaselinePlantParams = BaselinePlantParams(),
+    air: AirProps = AirProps(),
+    crop_area_m2=None,
+    dt_s: float = 60.0,
+    elapsed_s: float = 600.0,
+) -> Dict[str, object]:
+    """
+    simulate() for B cases in one pass (explicit Euler).
+
+    Any numeric field of the dataclasses (and crop_area_m2) may be an ndarray
+    of shape (B,), e.g. CouplingParams(LAI=np.linspace(0.5, 4, 64)); scalar
+    fields are shared by every case. dt_s and elapsed_s are scalars, so all
+    cases have the same steps.
+
+    Returns:
+      - columns: t_min (steps+1,); Tair_C, RH_air_pct, T_can_C (B, steps+1)
+      - Tout_C, Tin_final_C, RHin_final_pct, airflow_final_m3_s, ach_final_1_h,
+        heater_gas_total_m3, heater_elec_total_kwh, cooling_elec_total_kwh,
+        vents_elec_total_kwh, total_elec_kwh: (B,) arrays
+    """
+    steps = int(elapsed_s / dt_s)
+    n = steps + 1
+
+    kernel_inputs = [
+        np.asarray(x, dtype=float)
+        for x in _kernel_inputs(
+            geom, outside, init, building, act, coup, plant, air, crop_area_m2, dt_s
+        )
+    ]
+    energy_totals = [np.asarray(n * step, dtype=float) for step in _energy_steps(act, dt_s)]
+
+    # The energy-rate fields never reach the kernel, so they size the batch too
+    (B,) = np.broadcast_shapes((1,), *(x.shape for x in (*kernel_inputs, *energy_totals)))
+    inputs = [np.broadcast_to(x, (B,)) for x in kernel_inputs]
+
+    Tair_arr = np.empty((B, n))
+    vair_arr = np.empty((B, n))
+    Tcan_arr = np.empty((B, n))
+    Q_trans_arr = np.empty((B, n))
+    _run_batch(Tair_arr, vair_arr, Tcan_arr, Q_trans_arr, *inputs)
+
+    # Rearranged Eq (12) on the whole batch at once
+    RH_arr = np.clip(
+        100.0 * vair_arr * (Tair_arr + 273.15) * CVAP / es_magnus_tetens_pa_array(Tair_arr),
+        0.0, 100.0,
+    )
+
+    def per_case(x):
+        return np.broadcast_to(np.asarray(x, dtype=float), (B,))
+
+    Vdot = act.ACH * geom.V / 3600.0
+    heater_gas, heater_elec, cooling_elec, vents_elec = (per_case(x) for x in energy_totals)
+
+    return {
+        "columns": {
+            "t_min": np.arange(n) * (dt_s / 60.0),
+            "Tair_C": Tair_arr,
+            "RH_air_pct": RH_arr,
+            "T_can_C": Tcan_arr,
+        },
+        "Tout_C": per_case(outside.T_out_c),
+        "Tin_final_C": Tair_arr[:, -1],
+        "RHin_final_pct": RH_arr[:, -1],
+        "airflow_final_m3_s": per_case(Vdot),
+        "ach_final_1_h": per_case(act.ACH),
+        "heater_gas_total_m3": heater_gas,
+        "heater_elec_total_kwh": heater_elec,
+        "cooling_elec_total_kwh": cooling_elec,
+        "vents_elec_total_kwh": vents_elec,
+        "total_elec_kwh": heater_elec + cooling_elec + vents_elec,
     }
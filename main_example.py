@@ -7,6 +7,7 @@ from greenhouse_estimator import (
     estimate_environment, ActuatorMapping
 )
 import matplotlib.pyplot as plt
+import numpy as np
 
 def main() -> None:
     # Scenario
@@ -75,43 +76,44 @@ def main() -> None:
     print(f"Cooling electricity total (kWh): {result['cooling_elec_total_kwh']:.4f}")
     print(f"Vents electricity total (kWh): {result['vents_elec_total_kwh']:.4f}")
     print(f"Total electricity (kWh): {result['total_elec_kwh']:.4f}")
-    # --- Build vectors from the returned time-series ---
-    rows = result["rows"]
-    
-    t = [r["t_min"] for r in rows]
-    Tin = [r["Tair_C"] for r in rows]
-    RH = [r["RH_air_pct"] for r in rows]
-    airflow = [r.get("airflow_m3_s", 0.0) for r in rows]  # already in each row
+    # --- Vectors straight from the returned columnar time-series ---
+    cols = result["columns"]
+
+    t = cols["t_min"]
+    Tin = cols["Tair_C"]
+    RH = cols["RH_air_pct"]
+    airflow = cols["airflow_m3_s"]
 
     # --- Wind speed proxy (simple, derived from airflow) ---
     # NOTE: This is a proxy since the current simulator is single-zone and does not
     # explicitly simulate wind velocity fields. We estimate mean velocity at a
     # representative opening area A_open.
     A_open = 2.0  # m^2 (choose a representative effective opening area)
-    wind_speed = [(q / A_open) if A_open > 0 else 0.0 for q in airflow]  # m/s
+    wind_speed = airflow / A_open if A_open > 0 else np.zeros_like(airflow)  # m/s
 
     # --- "Amount of change" relative to the initial (t=0) values ---
-    Tin0 = Tin[0]
-    RH0 = RH[0]
-    dTin = [x - Tin0 for x in Tin]
-    dRH = [x - RH0 for x in RH]
+    dTin = Tin - Tin[0]
+    dRH = RH - RH[0]
     # Example: print first 3 rows of actuator energy bookkeeping
     r = result["rows"][-1]
     print({
-        "t_min": r["t_min"],
-
-        # cumulative values (preferred)
-        "heater_gas_m3_cum": r.get("heater_gas_m3_cum", None),
-        "heater_elec_kwh_cum": r.get("heater_elec_kwh_cum", None),
-        "cooling_elec_kwh_cum": r.get("cooling_elec_kwh_cum", None),
-        "vents_elec_kwh_cum": r.get("vents_elec_kwh_cum", None),
-        "total_elec_kwh_cum": r.get("total_elec_kwh_cum", None),
-
-        # optional diagnostics (if present)
-        "heater_gas_m3_h_rate": r.get("heater_gas_m3_h_rate", r.get("heater_gas_m3_h", None)),
-        "heater_gas_m3_step": r.get("heater_gas_m3_step", None),
-        "heater_elec_kwh_step": r.get("heater_elec_kwh_step", None),
-        "cooling_elec_kwh_step": r.get("cooling_elec_kwh_step", None),
+        name: r[name].item()
+        for name in (
+            "t_min",
+
+            # cumulative values (preferred)
+            "heater_gas_m3_cum",
+            "heater_elec_kwh_cum",
+            "cooling_elec_kwh_cum",
+            "vents_elec_kwh_cum",
+            "total_elec_kwh_cum",
+
+            # optional diagnostics
+            "heater_gas_m3_h_rate",
+            "heater_gas_m3_step",
+            "heater_elec_kwh_step",
+            "cooling_elec_kwh_step",
+        )
     })
     # --- 4 graphs on one page (no color specified) ---
     fig, axs = plt.subplots(2, 2, figsize=(12, 8))
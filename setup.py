@@ -0,0 +1,58 @@
+"""
+Optional build of the compiled Euler kernel (greenhouse_estimator/sim_kernel.pyx):
+
+    python setup.py build_ext --inplace
+
+The package works without it (numba or pure-Python kernel): without Cython, or
+when the extension fails to compile, it installs as pure Python. The
+single-zone script's kernel is not part of the package; see single_zone_core.pyx.
+"""
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # Cython is optional: install without the compiled kernels
+    cythonize = None
+
+_BUILD_ERRORS = (CCompilerError, ExecError, PlatformError)
+
+
+class optional_build_ext(build_ext):
+    """build_ext that warns instead of failing when a kernel cannot be built."""
+
+    def run(self):
+        try:
+            super().run()
+        except _BUILD_ERRORS as exc:
+            self.warn(f"compiled kernels not built ({exc}); using the Python kernels")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except _BUILD_ERRORS as exc:
+            self.warn(f"{ext.name} not built ({exc}); using the Python kernel")
+
+
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [Extension("greenhouse_estimator.sim_kernel", ["greenhouse_estimator/sim_kernel.pyx"])],
+        language_level=3,
+        compiler_directives={"boundscheck": False, "wraparound": False, "cdivision": True},
+    )
+
+setup(
+    name="greenhouse_estimator",
+    packages=["greenhouse_estimator"],
+    python_requires=">=3.10",  # dataclass(slots=True)
+    install_requires=["numpy"],
+    extras_require={
+        "jit": ["numba"],    # numba-compiled Euler kernels
+        "ivp": ["scipy"],    # simulate(..., method=<solve_ivp method>)
+        "build": ["cython"], # compiled kernel via build_ext
+    },
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": optional_build_ext},
+)
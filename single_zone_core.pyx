@@ -0,0 +1,106 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# Compiled build of single_zone_greenhouse_sim._simulate_core() (exact es),
+# no JIT warm-up. Not part of the greenhouse_estimator package; build it next
+# to the script with
+#
+#     cythonize -i single_zone_core.pyx
+#
+# The script falls back to numba or plain Python without it.
+from libc.math cimport exp, fabs
+
+cdef double CVAP = 461.5  # single_zone_greenhouse_sim.CVAP
+
+
+cdef inline double es_pa(double T_c) nogil:
+    """Eq (13): saturated vapor pressure es (Pa), T in °C."""
+    return 610.94 * exp((17.625 * T_c) / (243.04 + T_c))
+
+
+cdef inline double clamp_rh(double RH) nogil:
+    if RH < 0.0:
+        return 0.0
+    if RH > 100.0:
+        return 100.0
+    return RH
+
+
+def simulate_core(
+    double[:, ::1] out,
+    double T_air, double v_air, double T_can,
+    bint exponential,
+    const double[:] consts,
+    double es_tol,
+):
+    """
+    Fills out (8, n) with the rows of _simulate_core()'s result
+    (T_air, v_air, T_can, Q_trans_W, r_s, VEC, Q_conv_can_to_air_W, RH);
+    consts is the _kernel_inputs() constant sequence as a float array,
+    es_tol the es reuse tolerance (°C, 0 = exact).
+    """
+    cdef double v_out = consts[0], k_lat = consts[1], r_b = consts[2]
+    cdef double exp_term = consts[3], VEC_pref = consts[4], hA_can_air = consts[5]
+    cdef double a_env_vent = consts[6], b_env_vent = consts[7]
+    cdef double Q_air_gain_W = consts[8], Q_solar_can_W = consts[9]
+    cdef double inv_rhocpV = consts[10], inv_Ccan = consts[11]
+    cdef double vent_latent_coef = consts[12], inv_klat_dx = consts[13]
+    cdef double A_crop = consts[14], dt_s = consts[15]
+    cdef double air_decay = consts[16], air_gain = consts[17]
+    cdef double vap_decay = consts[18], vap_gain = consts[19]
+
+    cdef Py_ssize_t k, n = out.shape[1]
+    cdef double e_s_air, e_air, dT20, r_s, VEC, e_def, Q_trans_Wm2, Q_trans_W
+    cdef double Q_conv_can_to_air_W, T_air_next
+    cdef double T_es = T_air
+
+    with nogil:
+        for k in range(n):
+            # Eq (13) and Eq (12); RH of the incoming state (stored at k - 1)
+            if k == 0 or fabs(T_air - T_es) >= es_tol:
+                e_s_air = es_pa(T_air)
+                T_es = T_air
+            e_air = v_air * (T_air + 273.15) * CVAP
+            if k > 0:
+                out[7, k - 1] = clamp_rh(100.0 * e_air / e_s_air)
+
+            # Eq (14)-(16)
+            dT20 = T_air - 20.0
+            r_s = 82.0 + 570.0 * exp_term * (1.0 + 0.023 * dT20 * dT20)
+            VEC = VEC_pref / (r_b + r_s)
+            e_def = e_s_air - e_air
+            if e_def < 0.0:
+                e_def = 0.0
+            Q_trans_Wm2 = k_lat * VEC * e_def
+            Q_trans_W = Q_trans_Wm2 * A_crop
+
+            Q_conv_can_to_air_W = hA_can_air * (T_can - T_air)
+
+            # Eq (17)
+            if exponential:
+                v_air = v_out + (v_air - v_out) * vap_decay + Q_trans_Wm2 * inv_klat_dx * vap_gain
+            else:
+                v_air = v_air + (dt_s * (Q_trans_Wm2 - vent_latent_coef * (v_air - v_out))) * inv_klat_dx
+            if v_air < 0.0:
+                v_air = 0.0
+
+            # Energy balance (air)
+            if exponential:
+                T_air_next = T_air * air_decay + (b_env_vent + Q_air_gain_W + hA_can_air * T_can) * air_gain
+            else:
+                T_air_next = T_air + (
+                    (b_env_vent - a_env_vent * T_air + Q_air_gain_W + Q_conv_can_to_air_W) * inv_rhocpV
+                ) * dt_s
+            T_air = T_air_next
+
+            # Energy balance (canopy)
+            T_can = T_can + ((Q_solar_can_W - Q_conv_can_to_air_W - Q_trans_W) * inv_Ccan) * dt_s
+
+            out[0, k] = T_air
+            out[1, k] = v_air
+            out[2, k] = T_can
+            out[3, k] = Q_trans_W
+            out[4, k] = r_s
+            out[5, k] = VEC
+            out[6, k] = Q_conv_can_to_air_W
+
+        # The final state is the only one no later step evaluates es for
+        out[7, n - 1] = clamp_rh(100.0 * v_air * (T_air + 273.15) * CVAP / es_pa(T_air))
@@ -8,87 +8,35 @@
 from __future__ import annotations
 
 import math
+from collections import namedtuple
 from dataclasses import dataclass
-from typing import List, Dict, Optional
-
-
-# -----------------------------
-# Psychrometrics (Eq 12–13)
-# -----------------------------
-CVAP = 461.5  # J/(kg*K) used in Eq(12)
-
-def es_magnus_tetens_pa(T_c: float) -> float:
-    """Eq (13): saturated vapor pressure es (Pa), T in °C."""
-    return 610.94 * math.exp((17.625 * T_c) / (243.04 + T_c))
-
-def abs_humidity_from_rh(T_c: float, RH_pct: float) -> float:
-    """Eq (12) + Eq (13): absolute humidity v (kg/m^3)."""
-    es = es_magnus_tetens_pa(T_c)
-    T_k = T_c + 273.15
-    return es * (RH_pct / 100.0) / (T_k * CVAP)
-
-def rh_from_abs_humidity(T_c: float, v: float) -> float:
-    """Rearranged Eq (12): RH (%)."""
-    es = es_magnus_tetens_pa(T_c)
-    T_k = T_c + 273.15
-    RH = 100.0 * v * T_k * CVAP / es
-    return max(0.0, min(100.0, RH))
-
-def vapor_pressure_from_abs_humidity(T_c: float, v: float) -> float:
-    """From Eq (12): v = e / (T_k * Cvap)  =>  e = v * T_k * Cvap (Pa)."""
-    T_k = T_c + 273.15
-    return v * T_k * CVAP
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+# Model parameters, psychrometrics (Eq 12–13), trigger labels and the optional
+# numba decorators are shared with the package simulator
+from greenhouse_estimator._jit import njit, prange
+from greenhouse_estimator.models import AirProps, CouplingParams, Geometry, Initial, Outside
+from greenhouse_estimator.psychrometrics import (
+    CVAP,
+    es_magnus_tetens_pa,
+    es_magnus_tetens_pa_array,
+    abs_humidity_from_rh,
+    abs_humidity_from_rh_array,
+    rh_from_abs_humidity,
+    vapor_pressure_from_abs_humidity,
+)
+from greenhouse_estimator.simulator import (
+    build_trigger_labels,
+    build_trigger_string as _build_trigger_string,
+)
 
 
 # -----------------------------
 # Model parameters
 # -----------------------------
-@dataclass(frozen=True)
-class Geometry:
-    L: float  # m
-    W: float  # m
-    H: float  # m
-
-    @property
-    def V(self) -> float:  # air volume (m^3)
-        return self.L * self.W * self.H
-
-    @property
-    def A_floor(self) -> float:  # m^2
-        return self.L * self.W
-
-@dataclass(frozen=True)
-class Outside:
-    T_out_c: float
-    RH_out_pct: float
-    G_sun_w_m2: float  # shortwave irradiance proxy (W/m^2)
-
-@dataclass(frozen=True)
-class Initial:
-    T_air_c: float
-    RH_air_pct: float
-    T_canopy_c: float  # canopy initial temp (°C)
-
-@dataclass(frozen=True)
-class AirProps:
-    rho: float = 1.20   # kg/m^3
-    cp: float = 1006.0  # J/(kg*K)
-
-@dataclass(frozen=True)
-class CouplingParams:
-    LAI: float
-
-    # h = 10*LAI (Table 2)
-    h_per_LAI: float = 10.0  # W/(m^2*K) per LAI unit
-
-    # Transpiration equations (14–16)
-    k_lat: float = 2.45e6     # J/kg latent heat of vaporization (approx, near 20°C)
-    gamma: float = 66.0       # Pa/K (psychrometric constant in Pa/K, simple constant)
-    r_b: float = 200.0        # s/m (boundary-layer resistance, used in the paper block)
-    k_tp: float = 0.7         # transpiration parameter in Eq(16) (chosen)
-    rn_gain: float = 0.70     # R_n ≈ rn_gain * G (chosen proxy)
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Actuation:
     ACH: float            # 1/h (airflow proxy)
     UA_w_k: float         # W/K (envelope/insulation lumped)
@@ -107,143 +55,566 @@ def build_trigger_string(
     A_crop: float,
     Q_trans_W: float,
 ) -> str:
+    """greenhouse_estimator's build_trigger_string() on this script's dataclasses."""
+    return _build_trigger_string(
+        act.ACH, act.Q_heater_w, outside.G_sun_w_m2, coup.LAI, A_crop, Q_trans_W
+    )
+
+
+# -----------------------------
+# Fast Eq (13) for the kernel
+# -----------------------------
+# simulate(..., fast_exp=True) evaluates es in the kernel with _exp_approx
+# (rel. error < 4e-6) instead of math.exp. The public helpers above stay exact.
+@njit(fastmath=True, inline="always")
+def _exp_approx(x):
+    """exp(x) as 2**n * p(f), x*log2(e) = n + f, p a degree-4 fit of 2**f on [0, 1)."""
+    y = x * 1.4426950408889634
+    n = math.floor(y)
+    f = y - n
+    p = 1.0000035900 + f * (0.6929696206 + f * (0.2416211631 + f * (0.0517178265 + f * 0.0136839965)))
+    return math.ldexp(p, int(n))
+
+@njit(fastmath=True, inline="always")
+def _es_fast(T_c):
+    """Eq (13) through _exp_approx; argument stays within [-1.4, 3.1] for -20..50 °C."""
+    return 610.94 * _exp_approx((17.625 * T_c) / (243.04 + T_c))
+
+@njit(fastmath=True, inline="always")
+def _es(T_c, fast_exp):
+    """Eq (13) as used by the kernel: _es_fast() when fast_exp, else math.exp."""
+    if fast_exp:
+        return _es_fast(T_c)
+    return 610.94 * math.exp((17.625 * T_c) / (243.04 + T_c))
+
+
+# -----------------------------
+# Euler kernel (numba-compiled when available)
+# -----------------------------
+# Clamps are conditional expressions rather than max()/min(): compiled they
+# are the same select, as plain Python they skip the builtin call.
+@njit(inline="always")
+def _clamp_rh(RH):
+    return 0.0 if RH < 0.0 else (100.0 if RH > 100.0 else RH)
+
+
+@njit(cache=True, fastmath=True)
+def _step(T_air, v_air, T_can, e_s_air, exponential, consts):
     """
-    Purely descriptive flags; no control logic changes.
-    - heater_active: Q_heater_w > 0
-    - solar_active: outside.G_sun_w_m2 > 0
-    - ventilation_active: ACH > 0
-    - transpiration_active: Q_trans_W > 0
-    - canopy_convection_active: LAI > 0 (implies h=10*LAI) and A_crop > 0
+    Advance (T_air, v_air, T_can) by dt_s, given es(T_air) (Pa) from the
+    caller; T_air and v_air by explicit Euler,
+    or exactly for the lagged T_can / Q_trans_W when exponential is set.
+    consts is the sequence built by _kernel_inputs() (a tuple, or one row of
+    the simulate_batch() table).
+    Returns (T_air', v_air', T_can', Q_trans_W, r_s, VEC, Q_conv_can_to_air_W, RH),
+    the fluxes being those evaluated at the start of the step and RH (%,
+    unclamped) that of the incoming state, so its es is shared with Eq (14).
     """
-    flags = []
+    (v_out, k_lat, r_b, exp_term, VEC_pref, hA_can_air,
+     a_env_vent, b_env_vent, Q_air_gain_W, Q_solar_can_W,
+     inv_rhocpV, inv_Ccan, vent_latent_coef, inv_klat_dx, A_crop, dt_s,
+     air_decay, air_gain, vap_decay, vap_gain) = consts
+
+    # --- Derived psychrometrics for Eq(14), Eq (12) inlined ---
+    e_air = v_air * (T_air + 273.15) * CVAP         # Pa
+    RH_air = 100.0 * e_air / e_s_air
+
+    # Eq (16): stomatal resistance rs (s/m)
+    dT20 = T_air - 20.0
+    r_s = 82.0 + 570.0 * exp_term * (1.0 + 0.023 * dT20 * dT20)
+
+    # Eq (15): VEC
+    VEC = VEC_pref / (r_b + r_s)
 
-    if act.Q_heater_w > 0:
-        flags.append("heater")
-    if outside.G_sun_w_m2 > 0:
-        flags.append("solar")
-    if act.ACH > 0:
-        flags.append("ventilation")
-    if Q_trans_W > 0:
-        flags.append("transpiration")
-    if coup.LAI > 0 and A_crop > 0:
-        flags.append("canopy_convection(h=10LAI)")
+    # Eq (14): transpiration (W) over crop area; per m^2 is what Eq (17) needs
+    e_def = e_s_air - e_air
+    Q_trans_Wm2 = k_lat * VEC * (e_def if e_def > 0.0 else 0.0)
+    Q_trans_W = Q_trans_Wm2 * A_crop
 
-    return "|".join(flags) if flags else "none"
+    # h = 10*LAI (Table 2): canopy-air convection
+    Q_conv_can_to_air_W = hA_can_air * (T_can - T_air)
+
+    # Ventilation latent term for Eq(17)
+    Q_latent_vent_Wm2 = vent_latent_coef * (v_air - v_out)
+
+    if exponential:
+        # Eq (17) is linear in v_air: relax towards v_out plus the transpiration source
+        v_air = v_out + (v_air - v_out) * vap_decay + Q_trans_Wm2 * inv_klat_dx * vap_gain
+    else:
+        # Eq (17): dAH (kg/m^3) over dt
+        dAH = (dt_s * (Q_trans_Wm2 - Q_latent_vent_Wm2)) * inv_klat_dx
+        v_air = v_air + dAH
+    v_air = v_air if v_air > 0.0 else 0.0
+
+    # Energy balance (air): envelope + ventilation = (UA + mdot*cp) * (T_out - T_air)
+    if exponential:
+        # Linear in T_air: T_inf + (T_air - T_inf) * decay, as one multiply-add; stable for any dt_s
+        T_air = T_air * air_decay + (b_env_vent + Q_air_gain_W + hA_can_air * T_can) * air_gain
+    else:
+        dTair_dt = (b_env_vent - a_env_vent * T_air + Q_air_gain_W + Q_conv_can_to_air_W) * inv_rhocpV
+        T_air = T_air + dTair_dt * dt_s
+
+    # Energy balance (canopy)
+    dTcan_dt = (Q_solar_can_W - Q_conv_can_to_air_W - Q_trans_W) * inv_Ccan
+    T_can = T_can + dTcan_dt * dt_s
+
+    return T_air, v_air, T_can, Q_trans_W, r_s, VEC, Q_conv_can_to_air_W, RH_air
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_core(T_air, v_air, T_can, exponential, consts, n, es_tol, fast_exp):
+    """
+    Run n steps of _step from the initial state with _step's constants.
+    es is re-evaluated only once T_air has moved by es_tol (°C) or more since
+    its last evaluation; es_tol = 0 evaluates it every step (exact). fast_exp
+    evaluates it with _es_fast().
+    Returns the per-step arrays
+    (T_air, v_air, T_can, Q_trans_W, r_s, VEC, Q_conv_can_to_air_W, RH).
+    """
+    T_air_arr = np.empty(n)
+    v_air_arr = np.empty(n)
+    T_can_arr = np.empty(n)
+    Q_trans_arr = np.empty(n)
+    r_s_arr = np.empty(n)
+    VEC_arr = np.empty(n)
+    Q_conv_arr = np.empty(n)
+    RH_arr = np.empty(n)
+
+    T_es = T_air
+    e_s_air = 0.0
+    for k in range(n):
+        if k == 0 or abs(T_air - T_es) >= es_tol:
+            e_s_air = _es(T_air, fast_exp)
+            T_es = T_air
+        T_air, v_air, T_can, Q_trans_W, r_s, VEC, Q_conv_can_to_air_W, RH_air = _step(
+            T_air, v_air, T_can, e_s_air, exponential, consts
+        )
+        # RH of the state stored at k - 1 (the initial state's is not reported)
+        if k > 0:
+            RH_arr[k - 1] = _clamp_rh(RH_air)
+        T_air_arr[k] = T_air
+        v_air_arr[k] = v_air
+        T_can_arr[k] = T_can
+        Q_trans_arr[k] = Q_trans_W
+        r_s_arr[k] = r_s
+        VEC_arr[k] = VEC
+        Q_conv_arr[k] = Q_conv_can_to_air_W
+
+    # The final state is the only one no later step evaluates es for
+    RH_arr[n - 1] = _clamp_rh(100.0 * v_air * (T_air + 273.15) * CVAP / _es(T_air, fast_exp))
+
+    return T_air_arr, v_air_arr, T_can_arr, Q_trans_arr, r_s_arr, VEC_arr, Q_conv_arr, RH_arr
+
+
+try:  # optional compiled kernel, see single_zone_core.pyx
+    from single_zone_core import simulate_core as _compiled_core
+except ImportError:
+    _compiled_core = None
+
+
+def _run_kernel(T_air, v_air, T_can, exponential, consts, n, es_tol, fast_exp):
+    """
+    _simulate_core() through the compiled extension when it is built; the
+    extension evaluates es exactly, so fast_exp keeps the numba/Python path.
+    """
+    if _compiled_core is None or fast_exp:
+        return _simulate_core(T_air, v_air, T_can, exponential, consts, n, es_tol, fast_exp)
+    out = np.empty((8, n))
+    _compiled_core(out, T_air, v_air, T_can, exponential, np.asarray(consts), es_tol)
+    return tuple(out)
+
+
+@njit(cache=True, parallel=True)
+def _simulate_batch_core(T_air, v_air, T_can, exponential, consts, n, es_tol, fast_exp):
+    """
+    _simulate_core() for N independent cases, run in parallel under numba.
+    T_air, v_air, T_can: (N,) initial states; consts: (N, C) table, one
+    _kernel_inputs() row per case. Returns the same arrays with shape (N, n).
+    """
+    N = T_air.shape[0]
+    out = np.empty((8, N, n))
+    for i in prange(N):
+        series = _simulate_core(
+            T_air[i], v_air[i], T_can[i], exponential, consts[i], n, es_tol, fast_exp
+        )
+        for j in range(8):
+            out[j, i, :] = series[j]
+    return out
 
 
 # -----------------------------
-# Core coupled simulation
+# Adaptive integration (scipy)
 # -----------------------------
-def simulate(
+# Solvers that use the Jacobian; the explicit ones would ignore it with a warning
+_JAC_METHODS = ("Radau", "BDF", "LSODA")
+
+def _solve_ivp(method, T_air, v_air, T_can, consts, n, rtol=1e-6, atol=1e-9):
+    """
+    The _step model as a continuous ODE, integrated with
+    scipy.integrate.solve_ivp(method=...) and an analytical Jacobian.
+    Returns the arrays of _simulate_core(): states at t = dt_s, ..., n*dt_s,
+    fluxes at the start of each step.
+    """
+    try:
+        from scipy.integrate import solve_ivp
+    except ImportError as exc:
+        raise ImportError(f"method={method!r} requires scipy") from exc
+
+    (v_out, k_lat, r_b, exp_term, VEC_pref, hA_can_air,
+     a_env_vent, b_env_vent, Q_air_gain_W, Q_solar_can_W,
+     inv_rhocpV, inv_Ccan, vent_latent_coef, inv_klat_dx, A_crop, dt_s, *_) = consts
+    K_trans = k_lat * VEC_pref * A_crop
+    a_air = a_env_vent + hA_can_air
+
+    def transpiration(T_a, v_a, e_s_air=None):
+        """Eq (14)-(16): Q_trans_W, r_s, VEC, es and the vapour deficit (Pa)."""
+        if e_s_air is None:
+            e_s_air = 610.94 * np.exp((17.625 * T_a) / (243.04 + T_a))
+        deficit = e_s_air - v_a * (T_a + 273.15) * CVAP
+        dT20 = T_a - 20.0
+        r_s = 82.0 + 570.0 * exp_term * (1.0 + 0.023 * dT20 * dT20)
+        VEC = VEC_pref / (r_b + r_s)
+        return K_trans * np.maximum(0.0, deficit) / (r_b + r_s), r_s, VEC, e_s_air, deficit
+
+    def rhs(t, y):
+        T_a, v_a, T_c = y
+        Q_trans_W = transpiration(T_a, v_a)[0]
+        Q_conv_can_to_air_W = hA_can_air * (T_c - T_a)
+        return np.array([
+            inv_rhocpV * (b_env_vent - a_env_vent * T_a + Q_air_gain_W + Q_conv_can_to_air_W),
+            inv_klat_dx * (Q_trans_W / A_crop - vent_latent_coef * (v_a - v_out)),
+            inv_Ccan * (Q_solar_can_W - Q_conv_can_to_air_W - Q_trans_W),
+        ])
+
+    def jac(t, y):
+        T_a, v_a, T_c = y
+        _, r_s, _, e_s_air, deficit = transpiration(T_a, v_a)
+        if deficit > 0.0:
+            R = r_b + r_s
+            dR_dT = 570.0 * exp_term * 0.046 * (T_a - 20.0)
+            Tm = 243.04 + T_a
+            ddef_dT = e_s_air * 17.625 * 243.04 / (Tm * Tm) - v_a * CVAP
+            dQ_dT = K_trans * (ddef_dT - deficit * dR_dT / R) / R
+            dQ_dv = -K_trans * (T_a + 273.15) * CVAP / R
+        else:
+            dQ_dT = dQ_dv = 0.0
+        return np.array([
+            [-inv_rhocpV * a_air, 0.0, inv_rhocpV * hA_can_air],
+            [inv_klat_dx * dQ_dT / A_crop, inv_klat_dx * (dQ_dv / A_crop - vent_latent_coef), 0.0],
+            [inv_Ccan * (hA_can_air - dQ_dT), -inv_Ccan * dQ_dv, -inv_Ccan * hA_can_air],
+        ])
+
+    t_eval = np.arange(n + 1) * dt_s
+    sol = solve_ivp(
+        rhs, (0.0, t_eval[-1]), [T_air, v_air, T_can],
+        method=method, t_eval=t_eval, rtol=rtol, atol=atol,
+        **({"jac": jac} if method in _JAC_METHODS else {}),
+    )
+    if not sol.success:
+        raise RuntimeError(f"solve_ivp({method!r}) failed: {sol.message}")
+
+    # Clamp v_air as the Euler kernel does before the fluxes and RH are evaluated
+    T_a, v_a, T_c = sol.y[0], np.maximum(sol.y[1], 0.0), sol.y[2]
+    # One es pass over all n + 1 states: fluxes use the start of each step, RH the end
+    e_s = es_magnus_tetens_pa_array(T_a)
+    Q_trans_W, r_s, VEC, _, _ = transpiration(T_a[:-1], v_a[:-1], e_s[:-1])
+    Q_conv_can_to_air_W = hA_can_air * (T_c[:-1] - T_a[:-1])
+    RH = np.clip(100.0 * v_a[1:] * (T_a[1:] + 273.15) * CVAP / e_s[1:], 0.0, 100.0)
+    return T_a[1:], v_a[1:], T_c[1:], Q_trans_W, r_s, VEC, Q_conv_can_to_air_W, RH
+
+
+# -----------------------------
+# Kernel inputs
+# -----------------------------
+def _kernel_inputs(
     geom: Geometry,
     outside: Outside,
     init: Initial,
     act: Actuation,
     coup: CouplingParams,
-    air: AirProps = AirProps(),
-    crop_area_m2: Optional[float] = None,
-    dt_s: float = 60.0,
-    minutes: int = 10,
-) -> List[Dict[str, float]]:
-
+    air: AirProps,
+    crop_area_m2: Optional[float],
+    dt_s: float,
+):
+    """
+    Initial state and the run-invariant _step constants as
+    (T_air, v_air, T_can, consts). Uses NumPy ufuncs only, so any dataclass
+    field may also be a (N,) array of cases (see simulate_batch()).
+    """
     A_crop = crop_area_m2 if crop_area_m2 is not None else geom.A_floor
     V = geom.V
     dx_airlayers = geom.H  # mapping of "air-layer thickness" to room height
 
     # Outside humidity in absolute form
-    v_out = abs_humidity_from_rh(outside.T_out_c, outside.RH_out_pct)
+    v_out = abs_humidity_from_rh_array(outside.T_out_c, outside.RH_out_pct)
 
     # Initial states
     T_air = init.T_air_c
-    v_air = abs_humidity_from_rh(init.T_air_c, init.RH_air_pct)
+    v_air = abs_humidity_from_rh_array(init.T_air_c, init.RH_air_pct)
     T_can = init.T_canopy_c
 
     # Airflow from ACH
     Vdot = act.ACH * V / 3600.0         # m^3/s
     mdot = air.rho * Vdot               # kg/s
 
-    rows: List[Dict[str, float]] = []
-    steps = int(minutes * 60.0 / dt_s)
+    # Time-invariant terms
+    Rn = coup.rn_gain * outside.G_sun_w_m2  # W/m^2 proxy for Eq(16)
+    LAI_eff = np.maximum(1e-6, coup.LAI)
+    exp_term = np.exp(-(coup.k_tp * Rn) / LAI_eff)
+    VEC_pref = (2.0 * air.cp * air.rho * LAI_eff) / (coup.k_lat * coup.gamma)
+    h_can_air = coup.h_per_LAI * LAI_eff
+
+    C_can_areal = 30_000.0  # J/(m^2*K) chosen effective canopy thermal mass
+    Q_solar_air_W = act.tau_alpha_air * outside.G_sun_w_m2 * geom.A_floor
+    Q_solar_can_W = act.tau_alpha_can * outside.G_sun_w_m2 * geom.A_floor
+    a_env_vent = act.UA_w_k + mdot * air.cp
+    b_env_vent = a_env_vent * outside.T_out_c
+
+    # Exponential step: x' = x * decay + forcing * gain, gain = (1 - decay) / rate
+    # (-> dt as rate -> 0). The rates are run constants, so like a running
+    # product replacing a per-iteration pow, the exp()s are taken once here
+    # and each step is one multiply-add per state.
+    rhocpV = air.rho * air.cp * V
+    a_air = a_env_vent + h_can_air * A_crop                 # W/K
+    a_vap = act.ACH / 3600.0                                # 1/s
+    air_decay = np.exp(-a_air * dt_s / rhocpV)
+    vap_decay = np.exp(-a_vap * dt_s)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        air_gain = np.where(a_air > 0, (1.0 - air_decay) / a_air, dt_s / rhocpV)
+        vap_gain = np.where(a_vap > 0, (1.0 - vap_decay) / a_vap, dt_s)
+
+    consts = (
+        v_out, coup.k_lat, coup.r_b, exp_term, VEC_pref, h_can_air * A_crop,
+        a_env_vent, b_env_vent, act.Q_heater_w + Q_solar_air_W, Q_solar_can_W,
+        1.0 / rhocpV, 1.0 / (C_can_areal * A_crop),
+        (act.ACH / 3600.0) * dx_airlayers * coup.k_lat, 1.0 / (coup.k_lat * dx_airlayers),
+        A_crop, dt_s, air_decay, air_gain, vap_decay, vap_gain,
+    )
+    return T_air, v_air, T_can, consts
 
-    for k in range(steps + 1):
-        t_min = k * dt_s / 60.0
 
-        # --- Derived psychrometrics for Eq(14) ---
-        e_s_air = es_magnus_tetens_pa(T_air)                     # Pa
-        e_air = vapor_pressure_from_abs_humidity(T_air, v_air)   # Pa
+# -----------------------------
+# Simulation output
+# -----------------------------
+# Longest possible Triggers label (every flag set)
+_TRIGGERS_WIDTH = len(build_trigger_string(
+    Actuation(ACH=1.0, UA_w_k=0.0, Q_heater_w=1.0, tau_alpha_air=0.0, tau_alpha_can=0.0),
+    Outside(T_out_c=0.0, RH_out_pct=0.0, G_sun_w_m2=1.0),
+    CouplingParams(LAI=1.0),
+    A_crop=1.0,
+    Q_trans_W=1.0,
+))
+
+# One record per timestep, in the former row-dict key order.
+ROW_DTYPE = np.dtype([
+    ("t_min", "f8"),
+
+    # Requested in final table
+    ("Tout_C", "f8"),
+    ("Tair_C", "f8"),
+    ("Triggers", f"U{_TRIGGERS_WIDTH}"),
+
+    # Keep existing outputs (useful diagnostics)
+    ("RH_air_pct", "f8"),
+    ("v_air_g_m3", "f8"),
+    ("T_can_C", "f8"),
+    ("ACH_1_h", "f8"),
+    ("LAI", "f8"),
+    ("h_can_air_W_m2K", "f8"),
+    ("r_s_s_m", "f8"),
+    ("VEC", "f8"),
+    ("Q_trans_W", "f8"),
+    ("Q_conv_can_to_air_W", "f8"),
+    ("v_out_g_m3", "f8"),
+])
+
+# Lightweight per-step record with the ROW_DTYPE fields (._asdict() for a dict)
+StepRow = namedtuple("StepRow", ROW_DTYPE.names)
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationResult:
+    """
+    Time series from simulate() as a structured array (ROW_DTYPE), one record
+    per step. Columns also read as attributes: res.Tair_C is table["Tair_C"].
+    """
+    table: np.ndarray
 
-        # --- Net radiation proxy for Eq(16) ---
-        Rn = coup.rn_gain * outside.G_sun_w_m2  # W/m^2 proxy
+    def __getattr__(self, name: str) -> np.ndarray:
+        if name != "table" and name in ROW_DTYPE.names:
+            return self.table[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
-        # Eq (16): stomatal resistance rs (s/m)
-        LAI = max(1e-6, coup.LAI)
-        r_s = 82.0 + 570.0 * math.exp(-(coup.k_tp * Rn) / LAI) * (1.0 + 0.023 * (T_air - 20.0) ** 2)
+    def __len__(self) -> int:
+        return len(self.table)
 
-        # Eq (15): VEC
-        VEC = (2.0 * air.cp * air.rho * LAI) / (coup.k_lat * coup.gamma * (coup.r_b + r_s))
+    def __iter__(self) -> Iterator[StepRow]:
+        """Per-step StepRow records."""
+        return map(StepRow._make, self.table.tolist())
 
-        # Eq (14): transpiration (W) over crop area
-        Q_trans_W = coup.k_lat * VEC * max(0.0, (e_s_air - e_air)) * A_crop
+    def to_rows(self) -> Iterator[Dict[str, float]]:
+        """Yield the per-step row dicts."""
+        for row in self:
+            yield row._asdict()
 
-        # h = 10*LAI (Table 2): canopy-air convection
-        h_can_air = coup.h_per_LAI * LAI
-        Q_conv_can_to_air_W = h_can_air * A_crop * (T_can - T_air)
+    @property
+    def rows(self) -> List[Dict[str, float]]:
+        """The former List[Dict] return value, built on demand."""
+        return list(self.to_rows())
 
-        # Ventilation latent term for Eq(17)
-        Q_latent_vent_Wm2 = (act.ACH / 3600.0) * dx_airlayers * coup.k_lat * (v_air - v_out)
 
-        # Eq (17): dAH (kg/m^3) over dt
-        dAH = (dt_s * ((Q_trans_W / A_crop) - Q_latent_vent_Wm2)) / (coup.k_lat * dx_airlayers)
-        v_air = max(0.0, v_air + dAH)
+# -----------------------------
+# Core coupled simulation
+# -----------------------------
+def simulate(
+    geom: Geometry,
+    outside: Outside,
+    init: Initial,
+    act: Actuation,
+    coup: CouplingParams,
+    air: AirProps = AirProps(),
+    crop_area_m2: Optional[float] = None,
+    dt_s: float = 60.0,
+    minutes: int = 10,
+    method: str = "euler",
+    es_reuse_tol_c: float = 0.0,
+    fast_exp: bool = False,
+) -> SimulationResult:
+    """
+    method:
+      - "euler": explicit Euler for every state (default)
+      - "exponential": T_air and v_air advanced with the exact solution of
+        their linear ODEs over each step (T_can, Q_trans_W lagged), stable
+        for large dt_s
+      - any scipy.integrate.solve_ivp method ("LSODA", "BDF", "RK45", ...):
+        adaptive integration with an analytical Jacobian, reported on the
+        same dt_s grid (needs scipy)
+
+    es_reuse_tol_c: "euler"/"exponential" only. Reuse the last Eq (13) es
+    while T_air stays within this many °C of where it was evaluated, skipping
+    exp() calls once the air temperature settles. 0.0 (default) is exact;
+    es moves 6-9 % per °C over -20..50 °C, so e.g. 0.05 keeps its error
+    below ~0.5 %.
+
+    fast_exp: "euler"/"exponential" only. Evaluate Eq (13) es with the
+    polynomial _es_fast() (within 0.1 % over -20..50 °C) instead of
+    math.exp; runs on the numba/Python kernel, not the compiled extension.
+    """
+    if es_reuse_tol_c < 0.0:
+        raise ValueError("es_reuse_tol_c must be >= 0")
 
-        # Energy balance (air)
-        Q_env_W = act.UA_w_k * (outside.T_out_c - T_air)
-        Q_vent_sens_W = mdot * air.cp * (outside.T_out_c - T_air)
-        Q_solar_air_W = act.tau_alpha_air * outside.G_sun_w_m2 * geom.A_floor
+    # Kernel constants, as plain floats so the compiled signature is stable
+    T_air, v_air, T_can, consts = _kernel_inputs(geom, outside, init, act, coup, air, crop_area_m2, dt_s)
+    consts = tuple(float(x) for x in consts)
+    T_air, v_air, T_can = float(T_air), float(v_air), float(T_can)
 
-        dTair_dt = (Q_env_W + Q_vent_sens_W + act.Q_heater_w + Q_solar_air_W + Q_conv_can_to_air_W) / (air.rho * air.cp * V)
-        T_air = T_air + dTair_dt * dt_s
+    A_crop = crop_area_m2 if crop_area_m2 is not None else geom.A_floor
+    h_can_air = coup.h_per_LAI * max(1e-6, coup.LAI)
+    v_out = consts[0]
+
+    steps = int(minutes * 60.0 / dt_s)
+    n = steps + 1
 
-        # Energy balance (canopy)
-        C_can_areal = 30_000.0  # J/(m^2*K) chosen effective canopy thermal mass
-        Q_solar_can_W = act.tau_alpha_can * outside.G_sun_w_m2 * geom.A_floor
-        dTcan_dt = (Q_solar_can_W - Q_conv_can_to_air_W - Q_trans_W) / (C_can_areal * A_crop)
-        T_can = T_can + dTcan_dt * dt_s
-
-        RH_air = rh_from_abs_humidity(T_air, v_air)
-
-        # NEW: trigger string (descriptive)
-        triggers = build_trigger_string(
-            act=act,
-            outside=outside,
-            coup=coup,
-            A_crop=A_crop,
-            Q_trans_W=Q_trans_W,
+    if method in ("euler", "exponential"):
+        core = _run_kernel(
+            T_air, v_air, T_can, method == "exponential", consts, n, float(es_reuse_tol_c), bool(fast_exp)
         )
+    else:
+        core = _solve_ivp(method, T_air, v_air, T_can, consts, n)
+    (T_air_arr, v_air_arr, T_can_arr,
+     Q_trans_arr, r_s_arr, VEC_arr, Q_conv_arr, RH_air_arr) = core
+
+    trig_no_trans, trig_with_trans = build_trigger_labels(
+        ACH=act.ACH,
+        Q_heater_w=act.Q_heater_w,
+        G_sun_w_m2=outside.G_sun_w_m2,
+        LAI=coup.LAI,
+        A_crop=A_crop,
+    )
+
+    table = np.empty(n, dtype=ROW_DTYPE)
+    table["t_min"] = np.arange(n) * dt_s / 60.0
+
+    # Requested in final table
+    table["Tout_C"] = outside.T_out_c
+    table["Tair_C"] = T_air_arr
+    # NEW: trigger string (descriptive)
+    table["Triggers"] = np.where(Q_trans_arr > 0, trig_with_trans, trig_no_trans)
+
+    # Keep existing outputs (useful diagnostics)
+    table["RH_air_pct"] = RH_air_arr
+    table["v_air_g_m3"] = v_air_arr * 1000.0
+    table["T_can_C"] = T_can_arr
+    table["ACH_1_h"] = act.ACH
+    table["LAI"] = coup.LAI
+    table["h_can_air_W_m2K"] = h_can_air
+    table["r_s_s_m"] = r_s_arr
+    table["VEC"] = VEC_arr
+    table["Q_trans_W"] = Q_trans_arr
+    table["Q_conv_can_to_air_W"] = Q_conv_arr
+    table["v_out_g_m3"] = v_out * 1000.0
+
+    return SimulationResult(table)
+
+
+# -----------------------------
+# Batched simulation (parameter sweeps)
+# -----------------------------
+def simulate_batch(
+    geom: Geometry,
+    outside: Outside,
+    init: Initial,
+    act: Actuation,
+    coup: CouplingParams,
+    air: AirProps = AirProps(),
+    crop_area_m2=None,
+    dt_s: float = 60.0,
+    minutes: int = 10,
+    method: str = "euler",
+    es_reuse_tol_c: float = 0.0,
+    fast_exp: bool = False,
+) -> Dict[str, np.ndarray]:
+    """
+    simulate() for N cases in one call. Any dataclass field (and crop_area_m2)
+    may be a (N,) array; scalars are shared by all cases. Cases run in
+    parallel under numba.
 
-        rows.append({
-            "t_min": t_min,
+    method: "euler" or "exponential"; es_reuse_tol_c, fast_exp: see simulate().
 
-            # Requested in final table
-            "Tout_C": outside.T_out_c,
-            "Tair_C": T_air,
-            "Triggers": triggers,
+    Returns {name: array}: t_min (n,), and (N, n) arrays Tair_C, RH_air_pct,
+    v_air_g_m3, T_can_C, r_s_s_m, VEC, Q_trans_W, Q_conv_can_to_air_W.
+    """
+    if method not in ("euler", "exponential"):
+        raise ValueError(f"simulate_batch() supports 'euler' and 'exponential', not {method!r}")
+    if es_reuse_tol_c < 0.0:
+        raise ValueError("es_reuse_tol_c must be >= 0")
+
+    T_air, v_air, T_can, consts = _kernel_inputs(geom, outside, init, act, coup, air, crop_area_m2, dt_s)
+    T_air, v_air, T_can, *consts = (
+        np.ascontiguousarray(x, dtype=float)
+        for x in np.broadcast_arrays(*(np.atleast_1d(x) for x in (T_air, v_air, T_can, *consts)))
+    )
+    table = np.stack(consts, axis=1)   # (N, C): one row of _step constants per case
 
-            # Keep existing outputs (useful diagnostics)
-            "RH_air_pct": RH_air,
-            "v_air_g_m3": v_air * 1000.0,
-            "T_can_C": T_can,
-            "ACH_1_h": act.ACH,
-            "LAI": coup.LAI,
-            "h_can_air_W_m2K": h_can_air,
-            "r_s_s_m": r_s,
-            "VEC": VEC,
-            "Q_trans_W": Q_trans_W,
-            "Q_conv_can_to_air_W": Q_conv_can_to_air_W,
-            "v_out_g_m3": v_out * 1000.0,
-        })
+    steps = int(minutes * 60.0 / dt_s)
+    n = steps + 1
 
-    return rows
+    (T_air_arr, v_air_arr, T_can_arr,
+     Q_trans_arr, r_s_arr, VEC_arr, Q_conv_arr, RH_air_arr) = _simulate_batch_core(
+        T_air, v_air, T_can, method == "exponential", table, n, float(es_reuse_tol_c), bool(fast_exp)
+    )
+
+    return {
+        "t_min": np.arange(n) * dt_s / 60.0,
+        "Tair_C": T_air_arr,
+        "RH_air_pct": RH_air_arr,
+        "v_air_g_m3": v_air_arr * 1000.0,
+        "T_can_C": T_can_arr,
+        "r_s_s_m": r_s_arr,
+        "VEC": VEC_arr,
+        "Q_trans_W": Q_trans_arr,
+        "Q_conv_can_to_air_W": Q_conv_arr,
+    }
 
 
 def main() -> None:
@@ -271,7 +642,7 @@ def main() -> None:
 
     coup = CouplingParams(LAI=2.0)
 
-    rows = simulate(
+    res = simulate(
         geom=geom,
         outside=outside,
         init=init,
@@ -281,18 +652,21 @@ def main() -> None:
         minutes=10,
     )
 
-    # Final table (requested columns first)
-    print("t(min)\tTout(°C)\tTin(°C)\tTriggers\t\t\tRH(%)\tv(g/m3)")
-    for r in rows:
-        print(
-            f"{r['t_min']:>5.0f}\t"
-            f"{r['Tout_C']:>7.2f}\t"
-            f"{r['Tair_C']:>7.2f}\t"
-            f"{r['Triggers']:<28}\t"
-            f"{r['RH_air_pct']:>6.1f}\t"
-            f"{r['v_air_g_m3']:>7.3f}"
+    # Final table (requested columns first), formatted in one pass and printed once
+    header = "t(min)\tTout(°C)\tTin(°C)\tTriggers\t\t\tRH(%)\tv(g/m3)"
+    lines = (
+        f"{t_min:>5.0f}\t"
+        f"{T_out:>7.2f}\t"
+        f"{T_air:>7.2f}\t"
+        f"{triggers:<28}\t"
+        f"{RH_air:>6.1f}\t"
+        f"{v_air_g_m3:>7.3f}"
+        for t_min, T_out, T_air, triggers, RH_air, v_air_g_m3 in zip(
+            res.t_min.tolist(), res.Tout_C.tolist(), res.Tair_C.tolist(),
+            res.Triggers.tolist(), res.RH_air_pct.tolist(), res.v_air_g_m3.tolist(),
         )
-
+    )
+    print("\n".join((header, *lines)))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
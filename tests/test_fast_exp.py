@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+import single_zone_greenhouse_sim as sz
+from greenhouse_estimator.psychrometrics import es_magnus_tetens_pa
+
+RTOL = 1e-3  # 0.1 %
+
+
+@pytest.mark.parametrize("T_c", np.linspace(-20.0, 50.0, 701).tolist())
+def test_es_fast_within_bound(T_c):
+    assert sz._es_fast(T_c) == pytest.approx(es_magnus_tetens_pa(T_c), rel=RTOL)
+
+
+@pytest.fixture(scope="module")
+def runs():
+    args = dict(
+        geom=sz.Geometry(L=20.0, W=10.0, H=4.0),
+        outside=sz.Outside(T_out_c=-10.0, RH_out_pct=70.0, G_sun_w_m2=150.0),
+        init=sz.Initial(T_air_c=15.0, RH_air_pct=60.0, T_canopy_c=15.0),
+        act=sz.Actuation(ACH=2.0, UA_w_k=250.0, Q_heater_w=10_000.0, tau_alpha_air=0.25, tau_alpha_can=0.20),
+        coup=sz.CouplingParams(LAI=2.0),
+        minutes=60,
+    )
+    return sz.simulate(**args), sz.simulate(**args, fast_exp=True)
+
+
+def test_fast_exp_is_used(runs):
+    exact, fast = runs
+    assert not np.array_equal(fast.Q_trans_W, exact.Q_trans_W)
+
+
+@pytest.mark.parametrize("name", ["Tair_C", "RH_air_pct", "Q_trans_W"])
+def test_fast_exp_matches_exact(runs, name):
+    exact, fast = runs
+    np.testing.assert_allclose(getattr(fast, name), getattr(exact, name), rtol=RTOL)